@@ -8,14 +8,39 @@ Calculates parking requirements based on:
 - Palm Bay / Brevard County local amendments
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+from dataclasses import dataclass, field, fields
+from typing import Callable, Optional, Dict, List, NamedTuple, Sequence, Tuple
+from array import array
+from numbers import Real
+import bisect
+import functools
 import math
+import sys
 
+try:
+    import numpy as np
+except ImportError:  # NumPy only powers calculate_mixed_use_fast; scalar path is used without it
+    np = None
 
-@dataclass
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; calculate_mixed_use_fast uses plain NumPy without it
+    njit = None
+
+
+# Unformatted note record: (key, str.format template, positional args)
+NoteRecord = Tuple[str, str, tuple]
+
+
+@dataclass(frozen=True, slots=True)
 class ParkingRequirement:
-    """Parking calculation result"""
+    """
+    Parking calculation result (immutable - instances are shared via the cache).
+    
+    Notes are kept as unformatted records and exposed through .notes; they are
+    left out of repr, and dataclasses.asdict() returns the raw records (use
+    MixedUseResult.as_dict() for JSON export).
+    """
     use_type: str
     gross_sf: float
     units: Optional[int]
@@ -23,45 +48,316 @@ class ParkingRequirement:
     required_spaces: int
     ada_spaces: int
     total_spaces: int
-    notes: List[str]
+    _raw_notes: Tuple[NoteRecord, ...] = field(repr=False)
+    
+    @property
+    def notes(self) -> List[str]:
+        """Calculation notes, formatted on access"""
+        return [template.format(*args) for _, template, args in self._raw_notes]
+
+
+# Field names for flat dict export (cheaper than dataclasses.asdict's recursive copy);
+# raw note records are exported as the formatted notes
+_FIELDS = tuple(f.name for f in fields(ParkingRequirement) if f.name != "_raw_notes") + ("notes",)
+
+
+def _as_dict(result: ParkingRequirement) -> Dict:
+    """Flat dict view of a ParkingRequirement for JSON export"""
+    return {k: getattr(result, k) for k in _FIELDS}
+
+
+def _to_list(values: Sequence[int]) -> List[int]:
+    """Plain list of ints from a NumPy array or list"""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+class MixedUseResult(NamedTuple):
+    """Mixed-use parking result with shared parking analysis"""
+    individual: Tuple[ParkingRequirement, ...]
+    total_without_sharing: int
+    shared_parking_potential: int
+    potential_reduction: int
+    ada_total: int
+    notes: Tuple[str, ...]
+    
+    def as_dict(self) -> Dict:
+        """
+        JSON-ready dict (individual calculations exported as plain dicts).
+        
+        Per-use "notes" are empty unless calculate_mixed_use was called with
+        verbose=True (apart from unknown-use-type warnings).
+        """
+        return {
+            "individual_calculations": [_as_dict(r) for r in self.individual],
+            "total_without_sharing": self.total_without_sharing,
+            "shared_parking_potential": self.shared_parking_potential,
+            "potential_reduction": self.potential_reduction,
+            "ada_total": self.ada_total,
+            "notes": list(self.notes)
+        }
+
+
+class MixedUseBatchResult(NamedTuple):
+    """Vectorized mixed-use result: per-use counts plus shared parking analysis"""
+    required_by_use: Sequence[int]
+    ada_by_use: Sequence[int]
+    total_without_sharing: int
+    shared_parking_potential: int
+    potential_reduction: int
+    ada_total: int
+    notes: Tuple[str, ...]
+    
+    def as_dict(self) -> Dict:
+        """JSON-ready dict (per-use arrays exported as lists)"""
+        return {
+            "required_by_use": _to_list(self.required_by_use),
+            "ada_by_use": _to_list(self.ada_by_use),
+            "total_without_sharing": self.total_without_sharing,
+            "shared_parking_potential": self.shared_parking_potential,
+            "potential_reduction": self.potential_reduction,
+            "ada_total": self.ada_total,
+            "notes": list(self.notes)
+        }
 
 
 # Brevard County / Palm Bay Parking Ratios
+# "kind" selects the quantity the ratio applies to (see _CALC_SOURCE);
+# "ratio_nd" is the exact ratio as an integer (numerator, denominator) pair
 PARKING_RATIOS = {
     # Residential
-    "single_family": {"ratio": 2.0, "unit": "dwelling unit", "notes": "2 spaces per DU"},
-    "multi_family": {"ratio": 1.5, "unit": "dwelling unit", "notes": "1.5 spaces per DU + guest parking"},
-    "townhouse": {"ratio": 2.0, "unit": "dwelling unit", "notes": "2 spaces per DU"},
-    "senior_housing": {"ratio": 0.5, "unit": "dwelling unit", "notes": "0.5 spaces per DU"},
+    "single_family": {"ratio": 2.0, "ratio_nd": (2, 1), "unit": "dwelling unit", "kind": "du", "notes": "2 spaces per DU"},
+    "multi_family": {"ratio": 1.5, "ratio_nd": (3, 2), "unit": "dwelling unit", "kind": "du", "notes": "1.5 spaces per DU + guest parking"},
+    "townhouse": {"ratio": 2.0, "ratio_nd": (2, 1), "unit": "dwelling unit", "kind": "du", "notes": "2 spaces per DU"},
+    "senior_housing": {"ratio": 0.5, "ratio_nd": (1, 2), "unit": "dwelling unit", "kind": "du", "notes": "0.5 spaces per DU"},
     
     # Commercial
-    "retail": {"ratio": 4.0, "unit": "1,000 SF GFA", "notes": "4 spaces per 1,000 SF"},
-    "shopping_center": {"ratio": 4.5, "unit": "1,000 SF GLA", "notes": "4.5 spaces per 1,000 SF GLA"},
-    "restaurant": {"ratio": 10.0, "unit": "1,000 SF", "notes": "10 spaces per 1,000 SF or 1 per 3 seats"},
-    "fast_food": {"ratio": 12.0, "unit": "1,000 SF", "notes": "12 spaces per 1,000 SF"},
-    "bank": {"ratio": 4.0, "unit": "1,000 SF", "notes": "4 spaces per 1,000 SF + queue for drive-thru"},
+    "retail": {"ratio": 4.0, "ratio_nd": (4, 1), "unit": "1,000 SF GFA", "kind": "ksf", "notes": "4 spaces per 1,000 SF"},
+    "shopping_center": {"ratio": 4.5, "ratio_nd": (9, 2), "unit": "1,000 SF GLA", "kind": "ksf", "notes": "4.5 spaces per 1,000 SF GLA"},
+    "restaurant": {"ratio": 10.0, "ratio_nd": (10, 1), "unit": "1,000 SF", "kind": "ksf", "notes": "10 spaces per 1,000 SF or 1 per 3 seats"},
+    "fast_food": {"ratio": 12.0, "ratio_nd": (12, 1), "unit": "1,000 SF", "kind": "ksf", "notes": "12 spaces per 1,000 SF"},
+    "bank": {"ratio": 4.0, "ratio_nd": (4, 1), "unit": "1,000 SF", "kind": "ksf", "notes": "4 spaces per 1,000 SF + queue for drive-thru"},
     
     # Office
-    "office_general": {"ratio": 3.0, "unit": "1,000 SF", "notes": "3 spaces per 1,000 SF"},
-    "office_medical": {"ratio": 5.0, "unit": "1,000 SF", "notes": "5 spaces per 1,000 SF"},
-    "office_dental": {"ratio": 4.5, "unit": "1,000 SF", "notes": "4.5 spaces per 1,000 SF"},
+    "office_general": {"ratio": 3.0, "ratio_nd": (3, 1), "unit": "1,000 SF", "kind": "ksf", "notes": "3 spaces per 1,000 SF"},
+    "office_medical": {"ratio": 5.0, "ratio_nd": (5, 1), "unit": "1,000 SF", "kind": "ksf", "notes": "5 spaces per 1,000 SF"},
+    "office_dental": {"ratio": 4.5, "ratio_nd": (9, 2), "unit": "1,000 SF", "kind": "ksf", "notes": "4.5 spaces per 1,000 SF"},
     
     # Industrial
-    "warehouse": {"ratio": 1.0, "unit": "1,000 SF", "notes": "1 space per 1,000 SF"},
-    "manufacturing": {"ratio": 1.5, "unit": "1,000 SF", "notes": "1.5 spaces per 1,000 SF"},
-    "flex_space": {"ratio": 2.0, "unit": "1,000 SF", "notes": "2 spaces per 1,000 SF"},
+    "warehouse": {"ratio": 1.0, "ratio_nd": (1, 1), "unit": "1,000 SF", "kind": "ksf", "notes": "1 space per 1,000 SF"},
+    "manufacturing": {"ratio": 1.5, "ratio_nd": (3, 2), "unit": "1,000 SF", "kind": "ksf", "notes": "1.5 spaces per 1,000 SF"},
+    "flex_space": {"ratio": 2.0, "ratio_nd": (2, 1), "unit": "1,000 SF", "kind": "ksf", "notes": "2 spaces per 1,000 SF"},
     
     # Institutional
-    "church": {"ratio": 0.33, "unit": "seat", "notes": "1 space per 3 seats"},
-    "school_elementary": {"ratio": 2.0, "unit": "classroom", "notes": "2 spaces per classroom"},
-    "school_high": {"ratio": 8.0, "unit": "classroom", "notes": "8 spaces per classroom"},
-    "daycare": {"ratio": 1.0, "unit": "employee + 1 per 10 children", "notes": "Drop-off lane required"},
+    "church": {"ratio": 1 / 3, "ratio_nd": (1, 3), "unit": "seat", "kind": "seat", "notes": "1 space per 3 seats"},
+    "school_elementary": {"ratio": 2.0, "ratio_nd": (2, 1), "unit": "classroom", "kind": "classroom", "notes": "2 spaces per classroom"},
+    "school_high": {"ratio": 8.0, "ratio_nd": (8, 1), "unit": "classroom", "kind": "classroom", "notes": "8 spaces per classroom"},
+    "daycare": {"ratio": 1.0, "ratio_nd": (1, 1), "unit": "employee + 1 per 10 children", "kind": "default", "notes": "Drop-off lane required"},
     
     # Recreation
-    "gym_fitness": {"ratio": 5.0, "unit": "1,000 SF", "notes": "5 spaces per 1,000 SF"},
-    "hotel": {"ratio": 1.0, "unit": "room", "notes": "1 space per room + employee parking"},
+    "gym_fitness": {"ratio": 5.0, "ratio_nd": (5, 1), "unit": "1,000 SF", "kind": "ksf", "notes": "5 spaces per 1,000 SF"},
+    "hotel": {"ratio": 1.0, "ratio_nd": (1, 1), "unit": "room", "kind": "room", "notes": "1 space per room + employee parking"},
 }
 
+# Interned keys let lookups with interned use_type strings match on identity
+PARKING_RATIOS = {sys.intern(k): v for k, v in PARKING_RATIOS.items()}
+
+
+# Integer kind codes (index into the per-kind tables below)
+KIND_CODE = {"du": 0, "ksf": 1, "seat": 2, "room": 3, "classroom": 4, "default": 5}
+
+
+def _by_kind_code(table: Dict[str, object]) -> tuple:
+    """Order a kind-keyed table by KIND_CODE so it can be indexed by code"""
+    return tuple(table[kind] for kind in KIND_CODE)
+
+
+def _ratio_label(num: int, den: int) -> str:
+    """Ratio as shown in reports: decimal when exact (1.5), otherwise a fraction (1/3)"""
+    return str(num / den) if (num * 10**6) % den == 0 else f"{num}/{den}"
+
+
+# Struct-of-arrays view of PARKING_RATIOS, built once at import: calculations
+# use _USE_INDEX[use_type] into these columns; the dict is kept for introspection
+_USE_KEYS = tuple(PARKING_RATIOS)
+_USE_INDEX = {use_type: i for i, use_type in enumerate(_USE_KEYS)}
+_RATIO_NUM = array("q", [PARKING_RATIOS[k]["ratio_nd"][0] for k in _USE_KEYS])
+_RATIO_DEN = array("q", [PARKING_RATIOS[k]["ratio_nd"][1] for k in _USE_KEYS])
+_RATIO = array("d", [n / d for n, d in zip(_RATIO_NUM, _RATIO_DEN)])
+_KIND = bytes([KIND_CODE[PARKING_RATIOS[k]["kind"]] for k in _USE_KEYS])
+# Per-SF ratios from ratio_nd, precomputed so the SF-based calculation is a single
+# multiply: _RATIO_MICRO is spaces per SF in millionths, for exact integer ceil on whole SF
+_RATIO_PER_SF = array("d", [n / d / 1000 for n, d in zip(_RATIO_NUM, _RATIO_DEN)])
+_RATIO_MICRO = array("q", [n * 1000 // d for n, d in zip(_RATIO_NUM, _RATIO_DEN)])
+assert all(
+    (n * 1000) % d == 0
+    for n, d, kind in zip(_RATIO_NUM, _RATIO_DEN, _KIND)
+    if kind in (KIND_CODE["ksf"], KIND_CODE["default"])
+), "SF-based ratio_nd must be a whole number of spaces per 1,000,000 SF"
+_RATIO_LABEL = tuple(_ratio_label(n, d) for n, d in zip(_RATIO_NUM, _RATIO_DEN))
+_UNIT = tuple(PARKING_RATIOS[k]["unit"] for k in _USE_KEYS)
+_NOTES = tuple(PARKING_RATIOS[k]["notes"] for k in _USE_KEYS)
+
+
+# Source templates for per-use_type calculators f(g=gross_sf, u=units, s=seats) -> spaces,
+# generated on first use with the ratio constants inlined (see _compile_calculator);
+# {q} names the argument the ratio applies to
+_SF_SOURCE = (
+    "def required_spaces(g, u, s):\n"
+    "    w = int({q})\n"
+    "    if w == {q}:\n"
+    "        return ({micro} * w + 999_999) // 1_000_000\n"
+    "    return _ceil({per_sf!r} * {q})\n"
+)
+# Whole unit/seat counts (including integral floats) use exact integer ceil-div;
+# fractional counts fall back to ceil of the float product
+_COUNT_SOURCE = (
+    "def required_spaces(g, u, s):\n"
+    "    w = int({q})\n"
+    "    if w == {q}:\n"
+    "        return ({num} * w + {den_minus_1}) // {den}\n"
+    "    return _ceil({ratio!r} * {q})\n"
+)
+
+# (template, quantity argument) by kind
+_CALC_SOURCE = _by_kind_code({
+    "du": (_COUNT_SOURCE, "u"),
+    "ksf": (_SF_SOURCE, "g"),
+    "seat": (_COUNT_SOURCE, "s"),
+    "room": (_COUNT_SOURCE, "u"),
+    "classroom": (_COUNT_SOURCE, "u"),
+    "default": (_SF_SOURCE, "g"),
+})
+
+# Generated calculators by use_type
+_SPECIALIZED: Dict[str, Callable[[float, int, int], int]] = {}
+
+
+def _compile_calculator(use_type: str) -> Callable[[float, int, int], int]:
+    """Generate straight-line required-spaces arithmetic for one use_type"""
+    i = _USE_INDEX[use_type]
+    den = _RATIO_DEN[i]
+    template, q = _CALC_SOURCE[_KIND[i]]
+    source = template.format(
+        q=q, num=_RATIO_NUM[i], den=den, den_minus_1=den - 1, ratio=_RATIO[i],
+        micro=_RATIO_MICRO[i], per_sf=_RATIO_PER_SF[i]
+    )
+    namespace = {"_ceil": math.ceil}
+    exec(compile(source, f"<parking_calculator:{use_type}>", "exec"), namespace)
+    return namespace["required_spaces"]
+
+
+def specialized_calculator(use_type: str) -> Callable[[float, int, int], int]:
+    """
+    Required-spaces function for one use_type, for parameter sweeps.
+    
+    The returned f(gross_sf, units, seats) applies the standard ratio with the
+    same rounding as calculate_parking, but skips lookups, ADA and notes.
+    Unknown use types get the general office calculator, as in calculate_parking.
+    """
+    f = _SPECIALIZED.get(use_type)
+    if f is None:
+        if use_type not in _USE_INDEX:
+            return specialized_calculator("office_general")
+        f = _SPECIALIZED.setdefault(use_type, _compile_calculator(use_type))
+    return f
+
+
+# Unrounded requirement by kind for a custom float ratio: f(ratio, gross_sf, units, seats)
+_CALC_CUSTOM = _by_kind_code({
+    "du": lambda r, g, u, s: r * u,
+    "ksf": lambda r, g, u, s: r * (g / 1000),
+    "seat": lambda r, g, u, s: r * s,
+    "room": lambda r, g, u, s: r * u,
+    "classroom": lambda r, g, u, s: r * u,
+    "default": lambda r, g, u, s: r * (g / 1000),
+})
+
+# Shared notes for non-verbose results
+_EMPTY_NOTES: Tuple[NoteRecord, ...] = ()
+
+# Calculation trace by kind as (key, template); template args are
+# (ratio label, units, seats, sf_units, required)
+_CALC_NOTES = _by_kind_code({
+    "du": ("calc_du", "Calculation: {0} × {1} units = {4} spaces"),
+    "ksf": ("calc_ksf", "Calculation: {0} × {3:.2f} (1,000 SF) = {4} spaces"),
+    "seat": ("calc_seat", "Calculation: {0} × {2} seats = {4} spaces"),
+    "room": ("calc_room", "Calculation: {0} × {1} rooms = {4} spaces"),
+    "classroom": ("calc_classroom", "Calculation: {0} × {1} classrooms = {4} spaces"),
+    "default": ("calc_default", "Default calculation based on SF"),
+})
+
+# NumPy copies of the columns for calculate_mixed_use_fast
+if np is not None:
+    _RATIO_PER_SF_NP = np.array(_RATIO_PER_SF, dtype=np.float64)
+    _RATIO_MICRO_NP = np.array(_RATIO_MICRO, dtype=np.int64)
+    _RATIO_NUM_NP = np.array(_RATIO_NUM, dtype=np.int64)
+    _RATIO_DEN_NP = np.array(_RATIO_DEN, dtype=np.int64)
+    _RATIO_NP = np.array(_RATIO, dtype=np.float64)
+    _KIND_NP = np.frombuffer(_KIND, dtype=np.uint8)
+
+_KIND_KSF = KIND_CODE["ksf"]
+_KIND_SEAT = KIND_CODE["seat"]
+_KIND_DEFAULT = KIND_CODE["default"]
+
+
+def _required_np(use_idx, gross, units, seats, ratio_per_sf, ratio_micro, ratio_num, ratio_den, ratios, kinds):
+    """Required spaces per use with NumPy array ops (same rounding as calculate_parking)"""
+    kind = kinds[use_idx]
+    is_sf = (kind == _KIND_KSF) | (kind == _KIND_DEFAULT)
+    num, den = ratio_num[use_idx], ratio_den[use_idx]
+    whole_sf = gross.astype(np.int64)
+    required_sf = np.where(
+        gross == whole_sf,
+        (ratio_micro[use_idx] * whole_sf + 999_999) // 1_000_000,
+        np.ceil(ratio_per_sf[use_idx] * gross).astype(np.int64)
+    )
+    quantity = np.where(kind == _KIND_SEAT, seats, units)
+    whole_qty = quantity.astype(np.int64)
+    required_qty = np.where(
+        quantity == whole_qty,
+        (num * whole_qty + den - 1) // den,
+        np.ceil(ratios[use_idx] * quantity).astype(np.int64)
+    )
+    return np.where(is_sf, required_sf, required_qty)
+
+
+def _required_loop(use_idx, gross, units, seats, ratio_per_sf, ratio_micro, ratio_num, ratio_den, ratios, kinds):
+    """Required spaces per use as one loop; compiled with Numba when available"""
+    n = use_idx.shape[0]
+    out = np.empty(n, np.int64)
+    for j in range(n):
+        i = use_idx[j]
+        k = kinds[i]
+        if k == _KIND_KSF or k == _KIND_DEFAULT:
+            g = gross[j]
+            if g == math.floor(g):
+                out[j] = (ratio_micro[i] * np.int64(g) + 999_999) // 1_000_000
+            else:
+                out[j] = np.int64(math.ceil(ratio_per_sf[i] * g))
+        else:
+            q = seats[j] if k == _KIND_SEAT else units[j]
+            if q == math.floor(q):
+                den = ratio_den[i]
+                out[j] = (ratio_num[i] * np.int64(q) + den - 1) // den
+            else:
+                out[j] = np.int64(math.ceil(ratios[i] * q))
+    return out
+
+
+# Batch kernel for calculate_mixed_use_fast: Numba-compiled loop if installed,
+# otherwise the NumPy expression (the pure-Python loop is never used directly)
+_required_batch = _required_np
+if njit is not None and np is not None:
+    try:
+        _required_batch = njit(cache=True)(_required_loop)
+        # Compile at import so the first portfolio call doesn't pay for it
+        _required_batch(
+            np.zeros(1, np.intp), np.zeros(1, np.float64), np.zeros(1, np.float64), np.zeros(1, np.float64),
+            _RATIO_PER_SF_NP, _RATIO_MICRO_NP, _RATIO_NUM_NP, _RATIO_DEN_NP, _RATIO_NP, _KIND_NP
+        )
+    except Exception:  # Compilation problems must not break the module
+        _required_batch = _required_np
+
 
 # ADA Parking Requirements (2010 ADA Standards)
 ADA_REQUIREMENTS = [
@@ -78,22 +374,71 @@ ADA_REQUIREMENTS = [
 ]
 
 
-def calculate_ada_spaces(total_spaces: int) -> int:
-    """Calculate required ADA accessible spaces"""
+# Parallel threshold / requirement tuples for bisect lookup
+_ADA_THRESH = tuple(threshold for threshold, _ in ADA_REQUIREMENTS)
+_ADA_REQ = tuple(required for _, required in ADA_REQUIREMENTS)
+_ADA_MAX = _ADA_THRESH[-1]
+
+
+def _ada_spaces_bisect(total_spaces: float) -> int:
+    """ADA requirement by bisecting the threshold table (builds _ADA_TABLE; handles non-int counts)"""
     if total_spaces <= 0:
         return 0
     
-    for threshold, required in ADA_REQUIREMENTS:
-        if total_spaces <= threshold:
-            return required
+    i = bisect.bisect_left(_ADA_THRESH, total_spaces)
+    if i < len(_ADA_REQ):
+        return _ADA_REQ[i]
     
     # Over 1000 spaces: 20 + 1 for each 100 over 1000
-    return 20 + math.ceil((total_spaces - 1000) / 100)
+    return 20 + math.ceil((total_spaces - _ADA_MAX) / 100)
+
+
+# Lookup table for the common 0-1000 range: one index per call
+_ADA_TABLE = tuple(_ada_spaces_bisect(n) for n in range(_ADA_MAX + 1))
+
+
+def calculate_ada_spaces(total_spaces: int) -> int:
+    """Calculate required ADA accessible spaces"""
+    if type(total_spaces) is not int:
+        # Floats and NumPy integers can't index the table
+        return _ada_spaces_bisect(total_spaces)
+    if total_spaces <= _ADA_MAX:
+        return _ADA_TABLE[total_spaces] if total_spaces > 0 else 0
+    
+    # Over 1000 spaces: 20 + 1 for each 100 over 1000 (integer ceil-div)
+    return 20 + -(-(total_spaces - _ADA_MAX) // 100)
+
+
+if np is not None:
+    _ADA_THRESH_NP = np.array(_ADA_THRESH, dtype=np.int64)
+    _ADA_REQ_NP = np.array(_ADA_REQ, dtype=np.int64)
+
+
+def calculate_ada_spaces_vec(totals):
+    """
+    Vectorized calculate_ada_spaces over an array of space counts.
+    
+    Falls back to a per-item loop (returning a list) if NumPy is not installed.
+    """
+    if np is None:
+        return [calculate_ada_spaces(t) for t in totals]
+    
+    totals = np.asarray(totals)
+    over = np.maximum(totals - _ADA_MAX, 0)
+    if totals.dtype.kind in "iu":
+        extra = -(-over // 100)
+    else:
+        # Fractional counts: same rounding as the scalar fallback (_ada_spaces_bisect)
+        extra = np.ceil(over / 100).astype(np.int64)
+    idx = np.searchsorted(_ADA_THRESH_NP, totals, side="left")
+    in_table = idx < len(_ADA_REQ_NP)
+    base = np.where(in_table, _ADA_REQ_NP[np.minimum(idx, len(_ADA_REQ_NP) - 1)], 20)
+    return np.where(totals > 0, base + np.where(in_table, 0, extra), 0).astype(np.int64)
 
 
 def calculate_van_accessible(ada_spaces: int) -> int:
     """At least 1 in 6 accessible spaces must be van accessible"""
-    return max(1, math.ceil(ada_spaces / 6))
+    return (ada_spaces + 5) // 6 or 1
 
 
 def calculate_parking(
@@ -102,11 +447,18 @@ def calculate_parking(
     units: int = 0,
     seats: int = 0,
     employees: int = 0,
-    custom_ratio: Optional[float] = None
+    custom_ratio: Optional[float] = None,
+    verbose: bool = True
 ) -> ParkingRequirement:
     """
     Calculate parking requirements for a given use.
     
+    Results are memoized on the canonicalized argument tuple, so repeated
+    queries (portfolio scans, what-if sweeps) return the same immutable
+    ParkingRequirement instance. Batch callers should pass arguments
+    positionally in signature order (use_type, gross_sf, units, seats,
+    employees, custom_ratio, verbose), as calculate_mixed_use does.
+    
     Args:
         use_type: Type of use (from PARKING_RATIOS keys)
         gross_sf: Gross square footage
@@ -114,101 +466,211 @@ def calculate_parking(
         seats: Number of seats (for assembly uses)
         employees: Number of employees
         custom_ratio: Override standard ratio if local code differs
+        verbose: Record calculation notes; batch callers that only need counts
+            can pass False to skip them
     
     Returns:
-        ParkingRequirement object with calculation details
+        ParkingRequirement object with calculation details. Notes are stored
+        unformatted and only rendered when .notes is read; with verbose=False
+        they are empty apart from an unknown-use-type warning.
     """
-    notes = []
+    # Canonicalize so equivalent calls share one cache entry (a missing gross_sf
+    # is 0; a falsy custom_ratio means "use the standard ratio"). The cache is
+    # typed, so results keep the caller's int or float gross_sf / units.
+    return _calculate_parking_cached(
+        use_type, gross_sf or 0, units, seats, employees, custom_ratio or None, verbose
+    )
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _calculate_parking_cached(
+    use_type: str,
+    gross_sf: float,
+    units: int,
+    seats: int,
+    employees: int,
+    custom_ratio: Optional[float],
+    verbose: bool
+) -> ParkingRequirement:
+    """Memoized implementation of calculate_parking (canonical arguments only)"""
+    notes = _EMPTY_NOTES
     
-    if use_type not in PARKING_RATIOS:
-        notes.append(f"⚠️ Unknown use type '{use_type}', using general office ratio")
+    i = _USE_INDEX.get(use_type)
+    if i is None:
+        # Surfaced even for non-verbose calls
+        notes = (("unknown_use", "⚠️ Unknown use type '{}', using general office ratio", (use_type,)),)
         use_type = "office_general"
+        i = _USE_INDEX[use_type]
     
-    ratio_info = PARKING_RATIOS[use_type]
-    ratio = custom_ratio if custom_ratio else ratio_info["ratio"]
-    unit_type = ratio_info["unit"]
-    notes.append(ratio_info["notes"])
+    kind = _KIND[i]
     
     # Calculate base requirement
-    if "dwelling unit" in unit_type:
-        required = math.ceil(ratio * units)
-        notes.append(f"Calculation: {ratio} × {units} units = {required} spaces")
-    elif "1,000 SF" in unit_type:
-        sf_units = gross_sf / 1000
-        required = math.ceil(ratio * sf_units)
-        notes.append(f"Calculation: {ratio} × {sf_units:.2f} (1,000 SF) = {required} spaces")
-    elif "seat" in unit_type:
-        required = math.ceil(ratio * seats)
-        notes.append(f"Calculation: {ratio} × {seats} seats = {required} spaces")
-    elif "room" in unit_type:
-        required = math.ceil(ratio * units)
-        notes.append(f"Calculation: {ratio} × {units} rooms = {required} spaces")
-    elif "classroom" in unit_type:
-        required = math.ceil(ratio * units)
-        notes.append(f"Calculation: {ratio} × {units} classrooms = {required} spaces")
+    if custom_ratio:
+        label = str(custom_ratio)
+        required = math.ceil(_CALC_CUSTOM[kind](custom_ratio, gross_sf, units, seats))
     else:
-        required = math.ceil(ratio * (gross_sf / 1000))
-        notes.append(f"Default calculation based on SF")
+        label = _RATIO_LABEL[i]
+        required = specialized_calculator(use_type)(gross_sf, units, seats)
     
     # Calculate ADA requirements
     ada_spaces = calculate_ada_spaces(required)
-    van_accessible = calculate_van_accessible(ada_spaces)
-    notes.append(f"ADA: {ada_spaces} accessible spaces ({van_accessible} van accessible)")
     
-    # Total (ADA spaces are included in total, not additional)
-    total = required
+    if verbose:
+        # Van accessible count is only reported, so it is skipped for non-verbose calls
+        van_accessible = calculate_van_accessible(ada_spaces)
+        calc_key, calc_template = _CALC_NOTES[kind]
+        # gross_sf is only used (and only has to be numeric) for SF-based kinds
+        sf_units = gross_sf / 1000 if kind == _KIND_KSF or kind == _KIND_DEFAULT else 0
+        notes += (
+            ("rule", "{}", (_NOTES[i],)),
+            (calc_key, calc_template, (label, units, seats, sf_units, required)),
+            ("ada", "ADA: {} accessible spaces ({} van accessible)", (ada_spaces, van_accessible)),
+        )
     
+    # Total equals required (ADA spaces are included in total, not additional)
     return ParkingRequirement(
         use_type=use_type,
         gross_sf=gross_sf,
         units=units,
-        base_ratio=f"{ratio} per {unit_type}",
+        base_ratio=f"{label} per {_UNIT[i]}",
         required_spaces=required,
         ada_spaces=ada_spaces,
-        total_spaces=total,
-        notes=notes
+        total_spaces=required,
+        _raw_notes=notes
     )
 
 
-def calculate_mixed_use(uses: List[Dict]) -> Dict:
+def clear_caches() -> None:
+    """Reset memoized calculations (e.g. between tests)"""
+    _calculate_parking_cached.cache_clear()
+
+
+# Shared parking factor as an exact fraction: 85/100 = 15% potential reduction
+_SHARED_NUM, _SHARED_DEN = 85, 100
+
+SHARED_PARKING_NOTES = (
+    "Shared parking analysis based on ULI Shared Parking methodology",
+    "Actual reduction requires detailed time-of-day analysis",
+    "Local jurisdiction approval required for shared parking credits"
+)
+
+
+def _intern_use_type(use_type):
+    """Intern str use_type inputs; anything else goes to the unknown-use fallback as-is"""
+    return sys.intern(use_type) if type(use_type) is str else use_type
+
+
+def calculate_mixed_use(uses: List[Dict], verbose: bool = False) -> MixedUseResult:
     """
     Calculate parking for mixed-use development with potential shared parking reduction.
     
+    use_type strings (e.g. parsed from JSON) are interned before lookup, so
+    dynamically built names hit the ratio table and cache by identity. Non-str
+    use types (e.g. None) fall back to general office with a warning note.
+    
     Args:
         uses: List of dicts with keys: use_type, gross_sf, units, seats
+            (missing or None quantities count as 0)
+        verbose: Record per-use calculation notes (for reports), as in
+            calculate_parking; by default individual notes are empty apart
+            from unknown-use-type warnings
     
     Returns:
-        Dict with individual and total requirements plus shared parking analysis
+        MixedUseResult with individual and total requirements plus shared
+        parking analysis; use .as_dict() for JSON export
     """
     results = []
     total_required = 0
     
     for use in uses:
-        result = calculate_parking(
-            use_type=use.get("use_type", "office_general"),
-            gross_sf=use.get("gross_sf", 0),
-            units=use.get("units", 0),
-            seats=use.get("seats", 0)
+        ut, gsf, un, st = (
+            _intern_use_type(use.get("use_type", "office_general")), use.get("gross_sf") or 0,
+            use.get("units") or 0, use.get("seats") or 0
         )
+        result = calculate_parking(ut, gsf, un, st, 0, None, verbose)
         results.append(result)
         total_required += result.required_spaces
     
     # Shared parking analysis (simplified ULI model)
     # Peak times vary by use - potential for 10-15% reduction
-    shared_potential = math.ceil(total_required * 0.85)  # 15% potential reduction
-    
-    return {
-        "individual_calculations": [r.__dict__ for r in results],
-        "total_without_sharing": total_required,
-        "shared_parking_potential": shared_potential,
-        "potential_reduction": total_required - shared_potential,
-        "ada_total": calculate_ada_spaces(shared_potential),
-        "notes": [
-            "Shared parking analysis based on ULI Shared Parking methodology",
-            "Actual reduction requires detailed time-of-day analysis",
-            "Local jurisdiction approval required for shared parking credits"
+    shared_potential = -(-(total_required * _SHARED_NUM) // _SHARED_DEN)
+    
+    return MixedUseResult(
+        individual=tuple(results),
+        total_without_sharing=total_required,
+        shared_parking_potential=shared_potential,
+        potential_reduction=total_required - shared_potential,
+        ada_total=calculate_ada_spaces(shared_potential),
+        notes=SHARED_PARKING_NOTES
+    )
+
+
+def _batch_quantity(use: Dict, key: str) -> float:
+    """Quantity for the NumPy arrays; missing or None counts as 0"""
+    value = use.get(key) or 0
+    # np.fromiter would silently parse numeric strings; the scalar path raises
+    if not isinstance(value, Real):
+        raise TypeError(f"{key} must be a number, not {type(value).__name__}")
+    return value
+
+
+def calculate_mixed_use_fast(uses: List[Dict]) -> MixedUseBatchResult:
+    """
+    Vectorized calculate_mixed_use for large portfolios.
+    
+    Resolves every use to its ratio and kind in one pass and computes all
+    requirements in one batch (a Numba-compiled loop if Numba is installed,
+    otherwise NumPy array ops). Per-use ParkingRequirement objects and notes
+    are not built; use calculate_mixed_use when those are needed.
+    Falls back to the scalar calculation if NumPy is not installed.
+    
+    Args:
+        uses: List of dicts with keys: use_type, gross_sf, units, seats
+            (missing or None quantities count as 0; other non-numeric
+            quantities raise TypeError)
+    
+    Returns:
+        MixedUseBatchResult with per-use required and ADA spaces (arrays when
+        NumPy is available) plus shared parking analysis
+    """
+    if np is None:
+        required = [
+            calculate_parking(
+                _intern_use_type(use.get("use_type", "office_general")), use.get("gross_sf") or 0,
+                use.get("units") or 0, use.get("seats") or 0, 0, None, False
+            ).required_spaces
+            for use in uses
         ]
-    }
+        total_required = sum(required)
+    else:
+        n = len(uses)
+        default_idx = _USE_INDEX["office_general"]
+        use_idx = np.fromiter(
+            (_USE_INDEX.get(_intern_use_type(use.get("use_type", "office_general")), default_idx) for use in uses),
+            dtype=np.intp, count=n
+        )
+        # Missing or None quantities count as 0, as in calculate_mixed_use
+        gross = np.fromiter((_batch_quantity(use, "gross_sf") for use in uses), dtype=np.float64, count=n)
+        units = np.fromiter((_batch_quantity(use, "units") for use in uses), dtype=np.float64, count=n)
+        seats = np.fromiter((_batch_quantity(use, "seats") for use in uses), dtype=np.float64, count=n)
+        
+        required = _required_batch(
+            use_idx, gross, units, seats,
+            _RATIO_PER_SF_NP, _RATIO_MICRO_NP, _RATIO_NUM_NP, _RATIO_DEN_NP, _RATIO_NP, _KIND_NP
+        )
+        total_required = int(required.sum())
+    
+    shared_potential = -(-(total_required * _SHARED_NUM) // _SHARED_DEN)
+    
+    return MixedUseBatchResult(
+        required_by_use=required,
+        ada_by_use=calculate_ada_spaces_vec(required),
+        total_without_sharing=total_required,
+        shared_parking_potential=shared_potential,
+        potential_reduction=total_required - shared_potential,
+        ada_total=calculate_ada_spaces(shared_potential),
+        notes=SHARED_PARKING_NOTES
+    )
 
 
 # Example usage
@@ -239,7 +701,7 @@ if __name__ == "__main__":
         {"use_type": "office_general", "gross_sf": 20000},
         {"use_type": "restaurant", "gross_sf": 3000}
     ])
-    print(f"  Total Without Sharing: {mixed['total_without_sharing']} spaces")
-    print(f"  Shared Parking Potential: {mixed['shared_parking_potential']} spaces")
-    print(f"  Potential Reduction: {mixed['potential_reduction']} spaces")
-    print(f"  Total ADA Required: {mixed['ada_total']} spaces")
+    print(f"  Total Without Sharing: {mixed.total_without_sharing} spaces")
+    print(f"  Shared Parking Potential: {mixed.shared_parking_potential} spaces")
+    print(f"  Potential Reduction: {mixed.potential_reduction} spaces")
+    print(f"  Total ADA Required: {mixed.ada_total} spaces")
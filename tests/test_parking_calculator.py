@@ -0,0 +1,265 @@
+"""
+Parity tests for the parking calculator.
+
+calculate_mixed_use (generated per-use calculators) is the reference; the
+batch kernels behind calculate_mixed_use_fast must give identical counts.
+Regression tests for individual behaviours follow the parity tests.
+"""
+
+import pytest
+
+from analyzers import parking_calculator as pc
+
+
+# Whole and fractional SF, units and seats, church seat boundaries,
+# unknown use types and a portfolio large enough for the ADA >1000 branch
+USES = (
+    [{"use_type": use_type, "gross_sf": sf} for use_type in ("retail", "shopping_center", "restaurant", "office_dental", "daycare")
+     for sf in (0, 1, 999, 1000, 1001, 1234.5, 2222.2, 999.999, 10_000)]
+    + [{"use_type": use_type, "units": units} for use_type in ("multi_family", "senior_housing", "hotel", "school_high")
+       for units in (0, 1, 2, 3, 7, 10.0, 10.5, 3.2, 101)]
+    + [{"use_type": "church", "seats": seats} for seats in (0, 1, 2, 3, 4, 5, 6, 299, 300, 301, 100.5, 2.9, 3.0)]
+    + [
+        {"use_type": "not_a_use", "gross_sf": 1000},
+        {"use_type": None, "gross_sf": 1500.5},
+        {"gross_sf": 2000},
+        {"use_type": "multi_family", "gross_sf": None, "units": 50, "seats": None},
+        {"use_type": "warehouse", "gross_sf": 300_000},
+        {"use_type": "retail", "gross_sf": 400_000.5},
+    ]
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    pc.clear_caches()
+    yield
+    pc.clear_caches()
+
+
+def _batch_kernels():
+    np = pytest.importorskip("numpy")
+    kernels = {"numpy": pc._required_np, "python_loop": pc._required_loop}
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+    else:
+        kernels["numba"] = njit(pc._required_loop)
+    return np, kernels
+
+
+@pytest.mark.parametrize("kernel", ["numpy", "python_loop", "numba"])
+def test_fast_path_matches_scalar(monkeypatch, kernel):
+    np, kernels = _batch_kernels()
+    if kernel not in kernels:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(pc, "_required_batch", kernels[kernel])
+    
+    expected = pc.calculate_mixed_use(USES)
+    fast = pc.calculate_mixed_use_fast(USES)
+    
+    assert fast.required_by_use.tolist() == [r.required_spaces for r in expected.individual]
+    assert fast.ada_by_use.tolist() == [r.ada_spaces for r in expected.individual]
+    assert fast.total_without_sharing == expected.total_without_sharing > 1000
+    assert fast.shared_parking_potential == expected.shared_parking_potential
+    assert fast.potential_reduction == expected.potential_reduction
+    assert fast.ada_total == expected.ada_total
+
+
+def test_fast_path_without_numpy_matches_scalar(monkeypatch):
+    monkeypatch.setattr(pc, "np", None)
+    
+    expected = pc.calculate_mixed_use(USES)
+    fast = pc.calculate_mixed_use_fast(USES)
+    
+    assert list(fast.required_by_use) == [r.required_spaces for r in expected.individual]
+    assert list(fast.ada_by_use) == [r.ada_spaces for r in expected.individual]
+    assert fast.ada_total == expected.ada_total
+
+
+@pytest.mark.parametrize("use", USES)
+def test_specialized_calculator_matches_ratio(use):
+    use_type = use.get("use_type", "office_general")
+    info = pc.PARKING_RATIOS.get(use_type, pc.PARKING_RATIOS["office_general"])
+    gross, units, seats = (use.get(k) or 0 for k in ("gross_sf", "units", "seats"))
+    quantity = {"du": units, "room": units, "classroom": units, "seat": seats}.get(info["kind"], gross / 1000)
+    num, den = info["ratio_nd"]
+    # Exact reference: smallest integer >= num * quantity / den
+    exact = -(-(num * round(quantity * 10**6)) // (den * 10**6))
+    
+    assert pc.specialized_calculator(use_type)(gross, units, seats) == exact
+
+
+@pytest.mark.parametrize("total", [-1, 0, 1, 25, 26, 500, 501, 1000, 1001, 1100, 1101, 5000, 0.5, 25.5, 1000.0, 1000.5, 1100.5, -0.5])
+def test_ada_table_and_vec_match_bisect(total):
+    assert pc.calculate_ada_spaces(total) == pc._ada_spaces_bisect(total)
+    assert list(pc.calculate_ada_spaces_vec([total])) == [pc._ada_spaces_bisect(total)]
+
+
+def test_ada_vec_matches_scalar_for_mixed_counts():
+    totals = [1000.5, 0.5, 25.5, 26, 1101.0]
+    
+    assert list(pc.calculate_ada_spaces_vec(totals)) == [pc.calculate_ada_spaces(t) for t in totals] == [21, 1, 2, 2, 22]
+
+
+def test_gross_sf_is_ignored_for_unit_based_uses():
+    result = pc.calculate_parking("multi_family", gross_sf=None, units=50)
+    
+    assert result.required_spaces == 75
+    with pytest.raises(TypeError):
+        pc.calculate_parking("retail", gross_sf="1000")
+
+
+def test_calculate_parking_is_memoized():
+    first = pc.calculate_parking("retail", gross_sf=10_000)
+    
+    assert pc.calculate_parking("retail", 10_000) is first
+    assert pc._calculate_parking_cached.cache_info().hits == 1
+    
+    pc.clear_caches()
+    assert pc._calculate_parking_cached.cache_info().currsize == 0
+    assert pc.calculate_parking("retail", gross_sf=10_000) is not first
+
+
+def test_equivalent_arguments_share_a_cache_entry():
+    base = pc.calculate_parking("multi_family", units=50)
+    
+    # A missing gross_sf is 0 and a falsy custom_ratio means the standard ratio
+    assert pc.calculate_parking("multi_family", gross_sf=None, units=50) is base
+    assert pc.calculate_parking("multi_family", gross_sf=0.0, units=50) is base
+    assert pc.calculate_parking("multi_family", units=50, custom_ratio=0) is base
+
+
+def test_cache_keeps_caller_types():
+    as_int = pc.calculate_parking("retail", gross_sf=1000)
+    as_float = pc.calculate_parking("retail", gross_sf=1000.0)
+    
+    assert as_int is not as_float
+    assert type(as_int.gross_sf) is int and type(as_float.gross_sf) is float
+    assert as_int.required_spaces == as_float.required_spaces == 4
+
+
+def test_church_reports_exact_ratio():
+    result = pc.calculate_parking("church", seats=100)
+    
+    assert result.required_spaces == 34
+    assert result.base_ratio == "1/3 per seat"
+    assert "Calculation: 1/3 × 100 seats = 34 spaces" in result.notes
+    assert pc.calculate_parking("multi_family", units=50).base_ratio == "1.5 per dwelling unit"
+
+
+def test_unknown_and_none_use_type_fall_back_to_office():
+    result = pc.calculate_mixed_use([{"use_type": None, "gross_sf": 1000}])
+    
+    assert result.total_without_sharing == 3
+    assert result.individual[0].use_type == "office_general"
+    assert "Unknown use type 'None'" in result.individual[0].notes[0]
+    assert pc.calculate_mixed_use_fast([{"use_type": None, "gross_sf": 1000}]).total_without_sharing == 3
+
+
+def test_ada_accepts_non_int_counts():
+    assert pc.calculate_ada_spaces(1000.0) == 2
+    assert pc.calculate_ada_spaces(30.5) == 2
+    assert pc.calculate_ada_spaces(1050.5) == 21
+
+
+def test_mixed_use_as_dict_keeps_json_layout():
+    exported = pc.calculate_mixed_use([{"use_type": "retail", "gross_sf": 10_000}], verbose=True).as_dict()
+    
+    assert list(exported) == [
+        "individual_calculations", "total_without_sharing", "shared_parking_potential",
+        "potential_reduction", "ada_total", "notes"
+    ]
+    assert exported["individual_calculations"] == [{
+        "use_type": "retail",
+        "gross_sf": 10_000,
+        "units": 0,
+        "base_ratio": "4.0 per 1,000 SF GFA",
+        "required_spaces": 40,
+        "ada_spaces": 2,
+        "total_spaces": 40,
+        "notes": [
+            "4 spaces per 1,000 SF",
+            "Calculation: 4.0 × 10.00 (1,000 SF) = 40 spaces",
+            "ADA: 2 accessible spaces (1 van accessible)"
+        ]
+    }]
+    assert exported["notes"] == list(pc.SHARED_PARKING_NOTES)
+
+
+def test_mixed_use_notes_only_when_verbose():
+    uses = [{"use_type": "retail", "gross_sf": 1000}]
+    
+    assert pc.calculate_mixed_use(uses).as_dict()["individual_calculations"][0]["notes"] == []
+    assert pc.calculate_mixed_use(uses, verbose=True).as_dict()["individual_calculations"][0]["notes"]
+
+
+@pytest.mark.parametrize("use", [
+    {"use_type": "retail", "gross_sf": "1000"},
+    {"use_type": "multi_family", "units": "50"},
+    {"use_type": "church", "seats": "300"},
+])
+def test_fast_path_rejects_non_numeric_quantities(monkeypatch, use):
+    with pytest.raises(TypeError):
+        pc.calculate_mixed_use([use])
+    with pytest.raises(TypeError):
+        pc.calculate_mixed_use_fast([use])
+    
+    monkeypatch.setattr(pc, "np", None)
+    with pytest.raises(TypeError):
+        pc.calculate_mixed_use_fast([use])
+
+
+def test_parking_ratios_have_no_private_keys():
+    for info in pc.PARKING_RATIOS.values():
+        assert set(info) == {"ratio", "ratio_nd", "unit", "kind", "notes"}
+        assert info["ratio"] == info["ratio_nd"][0] / info["ratio_nd"][1]
+
+
+def test_per_sf_columns_follow_ratio_nd():
+    for i, use_type in enumerate(pc._USE_KEYS):
+        num, den = pc.PARKING_RATIOS[use_type]["ratio_nd"]
+        assert pc._RATIO_PER_SF[i] == num / den / 1000
+        if pc.PARKING_RATIOS[use_type]["kind"] in ("ksf", "default"):
+            assert pc._RATIO_MICRO[i] * den == num * 1000
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    (dict(use_type="multi_family", units=50), [
+        "1.5 spaces per DU + guest parking",
+        "Calculation: 1.5 × 50 units = 75 spaces",
+        "ADA: 3 accessible spaces (1 van accessible)",
+    ]),
+    (dict(use_type="retail", gross_sf=12_500), [
+        "4 spaces per 1,000 SF",
+        "Calculation: 4.0 × 12.50 (1,000 SF) = 50 spaces",
+        "ADA: 2 accessible spaces (1 van accessible)",
+    ]),
+    (dict(use_type="hotel", units=120), [
+        "1 space per room + employee parking",
+        "Calculation: 1.0 × 120 rooms = 120 spaces",
+        "ADA: 5 accessible spaces (1 van accessible)",
+    ]),
+    (dict(use_type="school_high", units=10), [
+        "8 spaces per classroom",
+        "Calculation: 8.0 × 10 classrooms = 80 spaces",
+        "ADA: 4 accessible spaces (1 van accessible)",
+    ]),
+    (dict(use_type="daycare", gross_sf=3000), [
+        "Drop-off lane required",
+        "Default calculation based on SF",
+        "ADA: 1 accessible spaces (1 van accessible)",
+    ]),
+    (dict(use_type="kiosk", gross_sf=1000), [
+        "⚠️ Unknown use type 'kiosk', using general office ratio",
+        "3 spaces per 1,000 SF",
+        "Calculation: 3.0 × 1.00 (1,000 SF) = 3 spaces",
+        "ADA: 1 accessible spaces (1 van accessible)",
+    ]),
+])
+def test_rendered_notes_match_original_strings(kwargs, expected):
+    result = pc.calculate_parking(**kwargs)
+    
+    assert result.notes == expected
+    assert "_raw_notes" not in repr(result)